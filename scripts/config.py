@@ -1,72 +1,100 @@
-import os
-import re
-from typing import List, Optional, Union
-
-from pydantic import field_validator, model_validator
-from pydantic_settings import BaseSettings
-
-
-
-LOCAL_DEV_MODE = False
-DEFAULT_SECRET_PREFIX = "/alpha/airflow/airflow_prod_laa/"
-
-
-class Settings(BaseSettings):
-    
-    AWS_REGION: str = "eu-west-1"
-    MOJAP_EXTRACTION_TS: int
-    MOJAP_IMAGE_VERSION: str
-    TABLE_PREFIX: Optional[str] = None
-    TABLES: str = None 
-
-    LANDING_FOLDER: Optional[str] = None
-    RAW_HIST_FOLDER: Optional[str] = None
-    CURATED_FOLDER: Optional[str] = None
-    METADATA_FOLDER: Optional[str] = None
-    LOGS_FOLDER: Optional[str] = None
-
-    @model_validator(mode="before")
-    def check_land_and_or_meta(cls, values):
-        """At least one of LANDING_FOLDER and METADATA_FOLDER must be
-        set"""
-        if (values.get("LANDING_FOLDER") is None) and (
-            values.get("METADATA_FOLDER") is None
-        ):
-            raise ValueError(
-                "At least one of LANDING_FOLDER or METADATA_FOLDER is required"
-            )
-        return values
-
-    @model_validator(mode="before")
-    def check_prefix_or_tables(cls, values):
-        """One and only one of TABLE_PREFIX and TABLES must be set"""
-        if (values.get("TABLE_PREFIX") is None) and (values.get("TABLES") is None):
-            raise ValueError("One of TABLE_PREFIX or TABLES is required")
-        if (values.get("TABLE_PREFIX") is not None) and (
-            values.get("TABLES") is not None
-        ):
-            raise ValueError("One and only one of TABLE_PREFIX and TABLES must be set")
-        return values
-
-    @classmethod
-    def string_match(cls, strg: str,
-                     match=re.compile(r'[A-Z0-9]+(_$)').match) -> bool:
-        """
-        Returns false if strg is NOT stringType
-        AND
-        Returns True only if pattern consists of Uppercase Alphanumerics
-        followed by an Underscore.
-        """
-        if not isinstance(strg, str):
-            return False
-        return bool(match(strg))
-
-
-print("Instantiating settings ...")
-if LOCAL_DEV_MODE:
-    settings = Settings(_env_file="dev.env")
-else:
-    settings = Settings()
-    
-os.environ["AWS_REGION"] = settings.AWS_REGION
-os.environ["AWS_DEFAULT_REGION"] = settings.AWS_REGION
\ No newline at end of file
+"""Pipeline configuration.
+
+A single Settings class covers every call site (optional fields such as
+TABLE_PREFIX and the folder locations default to None), and the one
+instance is built lazily through get_settings(). Keep it that way:
+per-environment variants belong in environment variables or a dotenv
+file, not in additional Settings classes, which would each pay a full
+pydantic schema build at import.
+"""
+import functools
+import os
+import re
+from typing import ClassVar, List, Optional, Union
+
+from pydantic import field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+
+LOCAL_DEV_MODE = False
+DEFAULT_SECRET_PREFIX = "/alpha/airflow/airflow_prod_laa/"
+
+
+class Settings(BaseSettings):
+
+    # Frozen instances skip per-assignment validation and make the
+    # cached get_settings() instance safe to share across threads.
+    model_config = SettingsConfigDict(frozen=True)
+
+    # Compiled once at class definition so every string_match call (and
+    # any validator built on it) shares the same pattern object.
+    _STRING_MATCH_PATTERN: ClassVar[re.Pattern] = re.compile(
+        r"[A-Z0-9]+(_$)"
+    )
+
+    AWS_REGION: str = "eu-west-1"
+    MOJAP_EXTRACTION_TS: int
+    MOJAP_IMAGE_VERSION: str
+    TABLE_PREFIX: Optional[str] = None
+    TABLES: str = None 
+
+    LANDING_FOLDER: Optional[str] = None
+    RAW_HIST_FOLDER: Optional[str] = None
+    CURATED_FOLDER: Optional[str] = None
+    METADATA_FOLDER: Optional[str] = None
+    LOGS_FOLDER: Optional[str] = None
+
+    @model_validator(mode="before")
+    def check_land_and_or_meta(cls, values):
+        """At least one of LANDING_FOLDER and METADATA_FOLDER must be
+        set"""
+        if (values.get("LANDING_FOLDER") is None) and (
+            values.get("METADATA_FOLDER") is None
+        ):
+            raise ValueError(
+                "At least one of LANDING_FOLDER or METADATA_FOLDER is required"
+            )
+        return values
+
+    @model_validator(mode="before")
+    def check_prefix_or_tables(cls, values):
+        """One and only one of TABLE_PREFIX and TABLES must be set"""
+        if (values.get("TABLE_PREFIX") is None) and (values.get("TABLES") is None):
+            raise ValueError("One of TABLE_PREFIX or TABLES is required")
+        if (values.get("TABLE_PREFIX") is not None) and (
+            values.get("TABLES") is not None
+        ):
+            raise ValueError("One and only one of TABLE_PREFIX and TABLES must be set")
+        return values
+
+    @classmethod
+    def string_match(cls, strg: str) -> bool:
+        """
+        Returns false if strg is NOT stringType
+        AND
+        Returns True only if pattern consists of Uppercase Alphanumerics
+        followed by an Underscore.
+        """
+        if not isinstance(strg, str):
+            return False
+        return bool(cls._STRING_MATCH_PATTERN.match(strg))
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Builds the Settings instance on first use and caches it.
+
+    Keeping this out of module import means importing config (e.g.
+    during Airflow DAG parsing or in tests) costs nothing; environment
+    validation happens once, on first access.
+    """
+    print("Instantiating settings ...")
+    if LOCAL_DEV_MODE:
+        settings = Settings(_env_file="dev.env")
+    else:
+        settings = Settings()
+
+    os.environ["AWS_REGION"] = settings.AWS_REGION
+    os.environ["AWS_DEFAULT_REGION"] = settings.AWS_REGION
+    return settings
\ No newline at end of file
@@ -1,11 +1,11 @@
 import argparse
 
-from config import settings
+from config import get_settings
 from functions import (
+    setup_logging,
     extract_data_to_s3,
-    load_data_from_s3,
-    cast_columns_to_correct_types,
-    add_mojap_columns_to_dataframe,
+    load_data_stream,
+    load_metadata,
     write_curated_table_to_s3,
     move_completed_files_to_raw_hist,
 )
@@ -16,11 +16,13 @@ def run_data_pipeline():
     easier to understand and maintain. It clearly shows the flow of data
     from extraction to loading.
     """
-    
-    df = load_data_from_s3()
-    df = cast_columns_to_correct_types(df)
-    df = add_mojap_columns_to_dataframe(df)
-    write_curated_table_to_s3(df)
+
+    # The stream's batches arrive already cast and with the MOJAP
+    # columns attached, so the parquet write consumes them one batch
+    # at a time and the full table is never held in memory.
+    # Metadata is loaded once per process (load_metadata is cached) and
+    # passed explicitly rather than through the default argument.
+    write_curated_table_to_s3(load_data_stream(), load_metadata())
     move_completed_files_to_raw_hist()
 
 if __name__ == "__main__":
@@ -30,6 +32,8 @@ if __name__ == "__main__":
     # used here to handle command-line arguments, allowing for greater
     # flexibility in how the pipeline is executed.
 
+    setup_logging()
+
     parser = argparse.ArgumentParser(description="Run data pipeline.")
 
     # Add arguments as needed, for example:
@@ -39,7 +43,7 @@ if __name__ == "__main__":
     # Move the data to Landing folder
     extract_data_to_s3()
 
-    if settings.TABLES:
+    if get_settings().TABLES:
         run_data_pipeline()
     else:
         print("Check the process")
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""Shared pytest fixtures.
+
+The moto mock is entered once per session and the test bucket is
+seeded once, instead of every AWS test re-patching botocore and
+re-creating its own bucket. Non-AWS tests never touch the fixture,
+so they skip the setup entirely.
+"""
+import os
+import sys
+
+import pytest
+
+# The pipeline modules import each other flat (from config import ...),
+# so tests resolve them the same way the scripts do.
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "scripts"
+    ),
+)
+
+# Dummy credentials so moto-intercepted clients can sign requests
+# without ever being able to reach real AWS.
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("AWS_SECURITY_TOKEN", "testing")
+os.environ.setdefault("AWS_SESSION_TOKEN", "testing")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+TEST_BUCKET = "test-bucket"
+TEST_KEYS = [
+    "landing/year=2023/people-part1.parquet",
+    "landing/year=2024/people-part2.parquet",
+    "landing/people-part3.parquet",
+]
+
+# Single source of truth for the sample rows, shared by the pandas
+# fixture in test_functions.py and the session-scoped parquet file.
+SAMPLE_DATA = {
+    "First Name": ["Ada", "Grace", "Mary"],
+    "Index": ["1", "2", "3"],
+    "Source extraction date": [
+        "2024-03-01T11:29:52",
+        "2024-03-01T11:29:52",
+        "2024-03-02T08:15:00",
+    ],
+}
+
+
+@pytest.fixture(scope="session")
+def sample_parquet(tmp_path_factory):
+    """One parquet file per session, written without compression: a
+    compressor round-trip is pure overhead at this size. Writing via
+    pq.write_table from literals skips pandas entirely."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = (
+        tmp_path_factory.mktemp("data") / "people.parquet"
+    )
+    pq.write_table(
+        pa.table(SAMPLE_DATA),
+        path,
+        compression=None,
+        row_group_size=3,
+    )
+    return str(path)
+
+
+def _seed_bucket(bucket_name, keys):
+    """Populates moto's in-memory S3 backend directly.
+
+    Seeding through the backend skips botocore's signer/serializer
+    round-trip per object; the code under test still exercises the
+    real client-side list path.
+    """
+    from moto.s3.models import s3_backends
+
+    backend = s3_backends["123456789012"]["global"]
+    backend.create_bucket(bucket_name, "us-east-1")
+    for key in keys:
+        backend.put_object(bucket_name, key, b"")
+
+
+@pytest.fixture(scope="session")
+def moto_aws():
+    """Yields an S3 client inside a session-wide moto mock.
+
+    The bucket and its keys are created once; tests that only read
+    them share the populated mock instead of rebuilding it.
+    """
+    # Imported here rather than at module top so filtered runs that
+    # never touch AWS skip loading boto3 and moto entirely.
+    import boto3
+    from moto import mock_aws
+
+    import functions
+
+    with mock_aws():
+        # moto only intercepts botocore sessions created after it is
+        # imported, and functions builds its shared session at module
+        # import - swap in a fresh one and drop the cached clients so
+        # the code under test talks to the mock.
+        functions._SESSION = boto3.session.Session()
+        functions.get_s3_resource.cache_clear()
+        functions.get_s3_client.cache_clear()
+        functions.get_glue_client.cache_clear()
+        _seed_bucket(TEST_BUCKET, TEST_KEYS)
+        yield boto3.client("s3", region_name="us-east-1")
+
+
+@pytest.fixture(scope="session")
+def glue_client(moto_aws):
+    """Yields a Glue client living inside the same moto session."""
+    import boto3
+
+    yield boto3.client("glue", region_name="us-east-1")
@@ -0,0 +1,258 @@
+"""Tests for the pipeline helpers in scripts/functions.py."""
+import copy
+
+import pandas as pd
+import pytest
+
+import functions
+from conftest import SAMPLE_DATA, TEST_BUCKET, TEST_KEYS
+
+
+@pytest.fixture(scope="module")
+def sample_metadata():
+    """Built once per module; tests that mutate it deep-copy first."""
+    from mojap_metadata import Metadata
+
+    return Metadata.from_dict(
+        {
+            "name": "people",
+            "columns": [
+                {"name": "First Name", "type": "string"},
+                {"name": "Index", "type": "int64"},
+                {
+                    "name": "Source extraction date",
+                    "type": "timestamp(ms)",
+                    "datetime_format": "%Y-%m-%dT%H:%M:%S",
+                },
+            ],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_dataframe():
+    """Built once per module; tests that mutate it copy first."""
+    return pd.DataFrame(SAMPLE_DATA)
+
+
+@pytest.fixture(autouse=True)
+def clear_listing_cache():
+    """Listings are cached per (bucket, prefix); start each test clean."""
+    functions._list_parquet_keys.cache_clear()
+    yield
+
+
+@pytest.mark.aws
+def test_list_parquet_files_in_s3(moto_aws):
+    files = functions.list_parquet_files_in_s3(
+        TEST_BUCKET, "landing"
+    )
+    assert sorted(files) == sorted(
+        f"s3://{TEST_BUCKET}/{key}" for key in TEST_KEYS
+    )
+
+
+@pytest.mark.aws
+@pytest.mark.parametrize(
+    # Partition values match as substrings of the key, so a bare
+    # value works as well as the full key=value component.
+    "partition", ["year=2024", "2024"]
+)
+def test_list_parquet_files_in_s3_filters_partitions(
+    moto_aws, partition
+):
+    files = functions.list_parquet_files_in_s3(
+        TEST_BUCKET, "landing", partitions={partition: "2024"}
+    )
+    assert files == [
+        f"s3://{TEST_BUCKET}/landing/year=2024/people-part2.parquet"
+    ]
+
+
+@pytest.mark.parametrize(
+    "column_name,column_type,datetime_format",
+    [
+        (
+            "Source extraction date",
+            "timestamp(ms)",
+            "%Y-%m-%dT%H:%M:%S",
+        ),
+        ("Index", "int64", None),
+        ("First Name", "string", None),
+        ("missing_column", "string", None),
+    ],
+)
+def test_cast_column_to_type(
+    sample_dataframe, column_name, column_type, datetime_format
+):
+    df = sample_dataframe.copy()
+    result = functions.cast_column_to_type(
+        df, column_name, column_type, datetime_format
+    )
+    if column_type == "timestamp(ms)":
+        # Single C-level kind check instead of the isinstance chain
+        # inside is_datetime64_any_dtype; repeated across every
+        # parametrized case it adds up.
+        assert result[column_name].dtype.kind == "M"
+    else:
+        assert result[column_name].dtype == column_type
+
+
+def test_cast_columns_to_correct_types(
+    sample_metadata, sample_dataframe, monkeypatch
+):
+    metadata = copy.deepcopy(sample_metadata)
+    df = sample_dataframe.copy()
+    monkeypatch.setattr(
+        functions, "load_metadata", lambda: metadata
+    )
+
+    result = functions.cast_columns_to_correct_types(df)
+
+    assert result["Source extraction date"].dtype.kind == "M"
+    assert result["Index"].dtype == "int64"
+    # update_metadata appends the MOJAP columns, so the cast fills
+    # the ones missing from the frame.
+    for column in functions.get_new_columns_definition():
+        assert column["name"] in result.columns
+
+
+def test_get_new_columns_definition():
+    names = [
+        column["name"]
+        for column in functions.get_new_columns_definition()
+    ]
+    assert names == [
+        "mojap_start_datetime",
+        "mojap_image_tag",
+        "mojap_raw_filename",
+        "mojap_task_timestamp",
+    ]
+
+
+def test_update_metadata(sample_metadata):
+    original_names = [
+        column["name"] for column in sample_metadata.columns
+    ]
+    metadata = functions.update_metadata(sample_metadata)
+    names = [column["name"] for column in metadata.columns]
+    for column in functions.get_new_columns_definition():
+        assert names.count(column["name"]) == 1
+    # The input (and therefore the cached load_metadata instance)
+    # must come back untouched.
+    assert [
+        column["name"] for column in sample_metadata.columns
+    ] == original_names
+
+
+def test_read_parquet_file_to_dataframe(
+    sample_parquet, sample_dataframe
+):
+    import pyarrow as pa
+
+    result = functions.read_parquet_file_to_dataframe(
+        sample_parquet
+    )
+    # Arrow's equals is a C-level buffer compare, rather than
+    # assert_frame_equal's per-column Python introspection.
+    assert pa.Table.from_pandas(result).equals(
+        pa.Table.from_pandas(sample_dataframe)
+    )
+
+
+@pytest.mark.aws
+def test_list_parquet_files_in_s3_paginates(moto_aws):
+    from conftest import _seed_bucket
+
+    keys = [
+        f"big/part-{i:04d}.parquet" for i in range(1500)
+    ]
+    _seed_bucket("pagination-bucket", keys + ["big/readme.txt"])
+
+    files = functions.list_parquet_files_in_s3(
+        "pagination-bucket", "big"
+    )
+    assert len(files) == 1500
+
+
+@pytest.mark.aws
+def test_create_glue_database_already_exists(glue_client):
+    db_dict = {
+        "name": "dami_intro_project",
+        "description": "database with data from people parquet",
+    }
+    functions.create_glue_database(glue_client, db_dict)
+    # A second call hits the AlreadyExistsException branch and
+    # returns without re-raising.
+    assert (
+        functions.create_glue_database(glue_client, db_dict)
+        is None
+    )
+    response = glue_client.get_database(
+        Name=db_dict["name"]
+    )
+    assert (
+        response["Database"]["Name"] == db_dict["name"]
+    )
+
+
+def test_add_mojap_columns_to_dataframe(
+    sample_dataframe, monkeypatch
+):
+    from types import SimpleNamespace
+
+    monkeypatch.setattr(
+        functions,
+        "get_settings",
+        lambda: SimpleNamespace(
+            MOJAP_IMAGE_VERSION="v0.0.1",
+            MOJAP_EXTRACTION_TS=1704451200,
+        ),
+    )
+    result = functions.add_mojap_columns_to_dataframe(
+        sample_dataframe.copy()
+    )
+    for column in functions.get_new_columns_definition():
+        assert column["name"] in result.columns
+    assert (
+        result["mojap_image_tag"] == "v0.0.1"
+    ).all()
+
+
+def test_load_data_stream_consumes_end_to_end(
+    sample_metadata, sample_parquet, monkeypatch
+):
+    import pyarrow.dataset as ds
+    from types import SimpleNamespace
+
+    monkeypatch.setattr(
+        functions, "load_metadata", lambda: sample_metadata
+    )
+    monkeypatch.setattr(
+        functions,
+        "_landing_dataset",
+        lambda partitions=None: ds.dataset(sample_parquet),
+    )
+    monkeypatch.setattr(
+        functions,
+        "get_settings",
+        lambda: SimpleNamespace(
+            MOJAP_IMAGE_VERSION="v0.0.1",
+            MOJAP_EXTRACTION_TS=1704451200,
+        ),
+    )
+
+    reader = functions.load_data_stream()
+    # Pull every batch through the reader; this is where a schema
+    # mismatch between the declared schema and the transformed
+    # batches would surface.
+    table = reader.read_all()
+
+    expected = functions.get_arrow_schema(
+        functions.update_metadata(sample_metadata)
+    )
+    assert table.schema.equals(expected)
+    assert table.num_rows == len(SAMPLE_DATA["Index"])
+    assert table.column("mojap_image_tag").to_pylist() == [
+        "v0.0.1"
+    ] * table.num_rows
@@ -0,0 +1,53 @@
+"""Tests for functions.setup_logging."""
+import logging
+
+import pytest
+
+from functions import setup_logging
+
+
+@pytest.fixture(scope="module")
+def configured_logger(tmp_path_factory):
+    """Configures the logger once for the whole module and restores
+    the root logger's handlers and level afterwards, so one
+    setup_logging call (and one FileHandler) serves every case."""
+    saved_handlers = logging.root.handlers[:]
+    saved_level = logging.root.level
+
+    path = str(
+        tmp_path_factory.mktemp("logs") / "test_pipeline.log"
+    )
+    logger = setup_logging(path, logging.DEBUG)
+    logger.info("write-through check")
+    for handler in logger.handlers:
+        handler.flush()
+
+    yield logger, path
+
+    for handler in logging.root.handlers:
+        if handler not in saved_handlers:
+            handler.close()
+    logging.root.handlers = saved_handlers
+    logging.root.setLevel(saved_level)
+
+
+@pytest.mark.parametrize(
+    "check",
+    ["returns_root", "level", "single_file_handler", "writes"],
+)
+def test_setup_logging(configured_logger, check):
+    logger, path = configured_logger
+    if check == "returns_root":
+        assert logger is logging.getLogger()
+    elif check == "level":
+        assert logger.level == logging.DEBUG
+    elif check == "single_file_handler":
+        file_handlers = [
+            handler
+            for handler in logger.handlers
+            if isinstance(handler, logging.FileHandler)
+        ]
+        assert len(file_handlers) == 1
+    else:
+        with open(path) as log_file:
+            assert "write-through check" in log_file.read()
@@ -0,0 +1,71 @@
+"""Tests for scripts/config.py."""
+import pytest
+
+# Imported once at module scope so pydantic builds the model class a
+# single time for the whole file.
+from config import Settings
+
+example_env_vars = {
+    "LANDING_FOLDER": "s3://test-bucket/de-intro/land/",
+    "RAW_HIST_FOLDER": "s3://test-bucket/de-intro/raw_history/",
+    "CURATED_FOLDER": "s3://test-bucket/de-intro/curated/",
+    "METADATA_FOLDER": "s3://test-bucket/de-intro/metadata/",
+    "MOJAP_EXTRACTION_TS": "1704451200",
+    "MOJAP_IMAGE_VERSION": "v0.0.1",
+    "TABLES": "peoples",
+}
+
+
+@pytest.fixture
+def example_env(monkeypatch):
+    """Sets the example environment; monkeypatch reverts it after the
+    test, so there is no manual os.environ cleanup loop."""
+    for key, value in example_env_vars.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.delenv("TABLE_PREFIX", raising=False)
+    return example_env_vars
+
+
+def test_example_settings_with_tables(example_env):
+    settings = Settings()
+    assert settings.TABLES == "peoples"
+    assert settings.MOJAP_EXTRACTION_TS == 1704451200
+    assert (
+        settings.LANDING_FOLDER
+        == example_env["LANDING_FOLDER"]
+    )
+
+
+def test_settings_require_land_or_meta(example_env, monkeypatch):
+    monkeypatch.delenv("LANDING_FOLDER")
+    monkeypatch.delenv("METADATA_FOLDER")
+    with pytest.raises(ValueError):
+        Settings()
+
+
+def test_settings_reject_prefix_and_tables(
+    example_env, monkeypatch
+):
+    monkeypatch.setenv("TABLE_PREFIX", "people")
+    with pytest.raises(ValueError):
+        Settings()
+
+
+def test_get_settings_is_cached_and_frozen(
+    example_env, monkeypatch
+):
+    from config import get_settings
+
+    # get_settings writes the resolved region back to os.environ;
+    # route those keys through monkeypatch so they revert after.
+    monkeypatch.setenv("AWS_REGION", "eu-west-1")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-west-1")
+
+    get_settings.cache_clear()
+    try:
+        settings = get_settings()
+        assert get_settings() is settings
+        with pytest.raises(Exception):
+            settings.TABLES = "other"
+    finally:
+        get_settings.cache_clear()